@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 
 BASE_DIR = Path("output")
@@ -10,164 +12,182 @@ DEMOGRAPHIC_FILE = BASE_DIR / "pc_voter_demographics_synthetic.csv"
 
 OUTPUT_FILE = BASE_DIR / "pc_final_metrics.csv"
 
-migration_df = pd.read_csv(MIGRATION_FILE)
-system_df = pd.read_csv(SYSTEM_LOAD_FILE)
-demo_df = pd.read_csv(DEMOGRAPHIC_FILE)
-
-# Merge all data on constituency identity
+# Explicit column types so the Arrow reader can skip type inference
+COUNT_COLUMNS = [
+    "total_registered_voters", "male_voters", "female_voters",
+    "age_18_25", "age_26_40", "age_41_60", "age_60_plus",
+    "form6_addition_requests", "form6_inward_migration", "form6_outward_migration",
+    "net_migration", "form7_deletion_requests", "form8_correction_requests",
+    "total_requests", "approved", "rejected", "pending",
+    "objections_raised", "objections_resolved", "objections_pending",
+    "freeze_period_pending", "officers_assigned",
+]
+RATE_COLUMNS = [
+    "literacy_rate_percent", "last_election_turnout_percent",
+    "avg_processing_time_days", "cases_per_officer",
+]
+KEY_COLUMNS = ["pc_id", "state", "constituency_name"]
+CSV_DTYPES = {
+    **{col: "category" for col in KEY_COLUMNS},
+    **{col: "Int32" for col in COUNT_COLUMNS},  # nullable, so blank cells read as NA
+    **{col: "float64" for col in RATE_COLUMNS},
+}
+
+def read_metrics_csv(path):
+    return pd.read_csv(path, engine="pyarrow", dtype=CSV_DTYPES, dtype_backend="numpy_nullable")
+
+migration_df = read_metrics_csv(MIGRATION_FILE)
+system_df = read_metrics_csv(SYSTEM_LOAD_FILE)
+demo_df = read_metrics_csv(DEMOGRAPHIC_FILE)
+
+# Share one pc_id dictionary so the join compares integer codes
+pc_id_dtype = demo_df["pc_id"].dtype
+migration_df["pc_id"] = migration_df["pc_id"].astype(pc_id_dtype)
+system_df["pc_id"] = system_df["pc_id"].astype(pc_id_dtype)
+
+# Join all data on constituency identity (pc_id is unique per constituency)
+SHARED_COLUMNS = ["state", "constituency_name", "data_origin", "anchor_level"]
 df = (
     demo_df
-    .merge(migration_df, on=["pc_id", "state", "constituency_name"], how="left")
-    .merge(system_df, on=["pc_id", "state", "constituency_name"], how="left")
+    .set_index("pc_id")
+    .join(
+        [
+            migration_df.set_index("pc_id").drop(columns=SHARED_COLUMNS),
+            system_df.set_index("pc_id").drop(columns=SHARED_COLUMNS),
+        ],
+        how="left"
+    )
+    .reset_index()
 )
 
+def as_float(x):
+    """Convert a column, array or scalar to float64, mapping missing values to NaN."""
+    if isinstance(x, (pd.Series, pd.DataFrame)):
+        return x.to_numpy(dtype=float, na_value=np.nan)
+    return np.asarray(x, dtype=float)
+
 def safe_div(a, b):
-    """Safely divide two numbers, returning NaN if division is invalid."""
-    return a / b if b not in (0, None, np.nan) else np.nan
+    """Divide element-wise, returning NaN where the divisor is zero or not finite."""
+    a = as_float(a)
+    b = as_float(b)
+    out = np.full(np.broadcast(a, b).shape, np.nan)
+    return np.divide(a, b, out=out, where=(b != 0) & np.isfinite(b))
 
 def deviation_score(value, reference):
-    if pd.isna(value) or pd.isna(reference) or reference == 0:
-        return np.nan
-    return 1 - abs(value - reference) / reference
-
-def normalize_partial(scores, weights):
-    valid = [(s, w) for s, w in zip(scores, weights) if not pd.isna(s)]
-    if not valid:
-        return np.nan
-    total_weight = sum(w for _, w in valid)
-    return sum(s * w for s, w in valid) / total_weight
+    if pd.isna(reference) or reference == 0:
+        return np.full(len(value), np.nan)
+    return 1 - np.abs(as_float(value) - reference) / reference
+
+def normalize_partial(scores, weights, out):
+    """Weighted average per row over the non-missing scores, written into ``out``."""
+    S = np.column_stack(scores)
+    mask = ~np.isnan(S)
+    total_weight = np.where(mask, weights, 0).sum(1)
+    out.fill(np.nan)
+    return np.divide(np.where(mask, S * weights, 0).sum(1), total_weight, out=out, where=total_weight > 0)
+
+# Component weights for each combined score
+SHS_WEIGHTS = np.array([0.25, 0.30, 0.20, 0.25])
+MPI_WEIGHTS = np.array([0.6, 0.4])
+APS_WEIGHTS = np.array([0.4, 0.35, 0.25])
 
 # Gender ratio - ideal is 0.5 (1000 females per 1000 males = 50% female voters)
 IDEAL_GENDER_RATIO = 0.5
 
-# National averages for age distribution
-national_age_avg = df[[
-    "age_18_25", "age_26_40", "age_41_60", "age_60_plus"
-]].mean()
-
-# National average literacy rate
-national_literacy_avg = df["literacy_rate_percent"].mean()
+AGE_COLUMNS = ["age_18_25", "age_26_40", "age_41_60", "age_60_plus"]
 
-# National average turnout
-national_turnout_avg = df["last_election_turnout_percent"].mean()
+# Per-constituency request rates, reused for the national averages below
+df["rejection_rate"] = safe_div(df["rejected"], df["total_requests"])
+df["objection_rate"] = safe_div(df["objections_raised"], df["total_requests"])
 
-# National average Form 6 requests
-national_form6_avg = df["form6_addition_requests"].mean()
+# National benchmarks, computed in a single aggregation pass
+national_stats = df.agg({
+    **{col: "mean" for col in AGE_COLUMNS},
+    "literacy_rate_percent": "mean",
+    "last_election_turnout_percent": "mean",
+    "form6_addition_requests": "mean",
+    "rejection_rate": "mean",
+    "objection_rate": "mean",
+    "cases_per_officer": "max",  # maximum, for normalization
+})
 
-# National average rejection rate
-national_rejection_rate_avg = (df["rejected"] / df["total_requests"]).mean()
+national_age_avg = national_stats[AGE_COLUMNS]
+national_literacy_avg = national_stats["literacy_rate_percent"]
+national_turnout_avg = national_stats["last_election_turnout_percent"]
+national_form6_avg = national_stats["form6_addition_requests"]
+national_rejection_rate_avg = national_stats["rejection_rate"]
+national_objection_rate_avg = national_stats["objection_rate"]
+national_max_cases_per_officer = national_stats["cases_per_officer"]
 
-# National average objection rate
-national_objection_rate_avg = (df["objections_raised"] / df["total_requests"]).mean()
 
-# National maximum cases per officer (for normalization)
-national_max_cases_per_officer = df["cases_per_officer"].max()
+# Result columns, allocated once and filled in place below
+N = len(df)
+SHS = np.empty(N)
+MPI = np.empty(N)
+APS = np.empty(N)
 
+# ---------- STATISTICAL HEALTH SCORE ----------
+# Measures how well demographic indicators align with national norms
 
-results = []
+# Gender Balance Score: Compare against ideal 50-50 ratio
+gender_ratio = safe_div(df["female_voters"], df["total_registered_voters"])
+GBS = deviation_score(gender_ratio, IDEAL_GENDER_RATIO)
 
-for _, row in df.iterrows():
-    
-    # ---------- STATISTICAL HEALTH SCORE ----------
-    # Measures how well demographic indicators align with national norms
-
-    # Gender Balance Score: Compare against ideal 50-50 ratio
-    gender_ratio = safe_div(row["female_voters"], row["total_registered_voters"])
-    GBS = deviation_score(gender_ratio, IDEAL_GENDER_RATIO)
-
-    # Age Distribution Score: Compare age breakdown with national average
-    age_vec = np.array([
-        row["age_18_25"],
-        row["age_26_40"],
-        row["age_41_60"],
-        row["age_60_plus"]
-    ])
-    age_avg_vec = national_age_avg.values
-    ADS = 1 - np.nanmean(np.abs(age_vec - age_avg_vec))
-
-    # Literacy Conformity Score: Compare with national average literacy
-    LCS = deviation_score(
-        row["literacy_rate_percent"],
-        national_literacy_avg
-    )
+# Age Distribution Score: Compare age breakdown with national average
+age_mat = as_float(df[AGE_COLUMNS])
+ADS = 1 - np.nanmean(np.abs(age_mat - as_float(national_age_avg)), axis=1)
 
-    # Turnout Alignment Score: Compare with national average turnout
-    TAS = deviation_score(
-        row["last_election_turnout_percent"],
-        national_turnout_avg
-    )
+# Literacy Conformity Score: Compare with national average literacy
+LCS = deviation_score(df["literacy_rate_percent"], national_literacy_avg)
 
-    # Combined Statistical Health Score (weighted average)
-    SHS = normalize_partial(
-        [GBS, ADS, LCS, TAS],
-        [0.25, 0.30, 0.20, 0.25]
-    )
+# Turnout Alignment Score: Compare with national average turnout
+TAS = deviation_score(df["last_election_turnout_percent"], national_turnout_avg)
 
-    # ---------- MIGRATION PRESSURE INDEX ----------
-    # Measures the scale and intensity of voter migration activity
+# Combined Statistical Health Score (weighted average)
+normalize_partial([GBS, ADS, LCS, TAS], SHS_WEIGHTS, out=SHS)
 
-    # Net Migration Intensity: Ratio of net migration to Form 6 requests
-    NMI = safe_div(
-        abs(row["net_migration"]),
-        row["form6_addition_requests"]
-    )
+# ---------- MIGRATION PRESSURE INDEX ----------
+# Measures the scale and intensity of voter migration activity
 
-    # Form 6 Request Ratio: Compare Form 6 volume to national average
-    F6R = safe_div(
-        row["form6_addition_requests"],
-        national_form6_avg
-    )
+# Net Migration Intensity: Ratio of net migration to Form 6 requests
+NMI = safe_div(df["net_migration"].abs(), df["form6_addition_requests"])
 
-    # Combined Migration Pressure Index (weighted average)
-    MPI = normalize_partial(
-        [NMI, F6R],
-        [0.6, 0.4]
-    )
+# Form 6 Request Ratio: Compare Form 6 volume to national average
+F6R = safe_div(df["form6_addition_requests"], national_form6_avg)
 
-    # ---------- ABUSE OF PROCESS SCORE ----------
-    # Measures potential indicators of electoral roll manipulation or system stress
+# Combined Migration Pressure Index (weighted average)
+normalize_partial([NMI, F6R], MPI_WEIGHTS, out=MPI)
 
-    # Rejection Rate Deviation: Compare rejection rate to national average
-    rejection_rate = safe_div(row["rejected"], row["total_requests"])
-    RRD = safe_div(
-        rejection_rate,
-        national_rejection_rate_avg
-    )
+# ---------- ABUSE OF PROCESS SCORE ----------
+# Measures potential indicators of electoral roll manipulation or system stress
 
-    # Objection Deviation: Compare objection rate to national average
-    objection_rate = safe_div(row["objections_raised"], row["total_requests"])
-    ODD = safe_div(
-        objection_rate,
-        national_objection_rate_avg
-    )
+# Rejection Rate Deviation: Compare rejection rate to national average
+RRD = safe_div(df["rejection_rate"], national_rejection_rate_avg)
 
-    # Administrative Load Pressure: Compare workload to national maximum
-    ALP = safe_div(
-        row["cases_per_officer"],
-        national_max_cases_per_officer
-    )
+# Objection Deviation: Compare objection rate to national average
+ODD = safe_div(df["objection_rate"], national_objection_rate_avg)
 
-    # Combined Abuse of Process Score (weighted average)
-    APS = normalize_partial(
-        [RRD, ODD, ALP],
-        [0.4, 0.35, 0.25]
-    )
+# Administrative Load Pressure: Compare workload to national maximum
+ALP = safe_div(df["cases_per_officer"], national_max_cases_per_officer)
 
-    # ---------- STORE RESULTS ----------
-    
-    results.append({
-        "pc_id": row["pc_id"],
-        "state": row["state"],
-        "constituency_name": row["constituency_name"],
-        "statistical_health_score": round(SHS, 4) if not pd.isna(SHS) else None,
-        "migration_pressure_index": round(MPI, 4) if not pd.isna(MPI) else None,
-        "abuse_of_process_score": round(APS, 4) if not pd.isna(APS) else None
-    })
+# Combined Abuse of Process Score (weighted average)
+normalize_partial([RRD, ODD, ALP], APS_WEIGHTS, out=APS)
 
 # ---------------- OUTPUT ----------------
 
-final_df = pd.DataFrame(results)
-final_df.to_csv(OUTPUT_FILE, index=False)
+final_df = pd.DataFrame({
+    "pc_id": df["pc_id"].values,
+    "state": df["state"].values,
+    "constituency_name": df["constituency_name"].values,
+    "statistical_health_score": SHS,
+    "migration_pressure_index": MPI,
+    "abuse_of_process_score": APS
+})
+
+# Round all scores at once; NaN passes through and is written as an empty field
+SCORE_COLUMNS = ["statistical_health_score", "migration_pressure_index", "abuse_of_process_score"]
+final_df[SCORE_COLUMNS] = final_df[SCORE_COLUMNS].round(4)
+pacsv.write_csv(pa.Table.from_pandas(final_df, preserve_index=False), str(OUTPUT_FILE))
 
 print(" Final constituency-level metrics computed successfully.")
 print(f" Output saved to: {OUTPUT_FILE}")
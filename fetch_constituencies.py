@@ -2,7 +2,9 @@ import os
 import re
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
@@ -18,6 +20,22 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 CONSTITUENCIES_OUT = f"{OUTPUT_DIR}/indian_constituencies.csv"
 GOOGLE_URL = "https://www.googleapis.com/customsearch/v1"
 
+# Search queries run concurrently over one pooled session (connection reuse)
+SEARCH_WORKERS = 8
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=SEARCH_WORKERS, pool_maxsize=SEARCH_WORKERS))
+
+# Constituency mention patterns, compiled once at module load
+CONSTITUENCY_PATTERNS = [
+    # Pattern 1: "Name (Lok Sabha constituency)"
+    re.compile(r"([A-Z][A-Za-z\s\-]+)\s+\(Lok Sabha constituency\)"),
+    # Pattern 2: "Name Lok Sabha"
+    re.compile(r"([A-Z][A-Za-z\s\-]+)\s+Lok Sabha"),
+    # Pattern 3: State-wise mentions
+    re.compile(r"([A-Z][A-Za-z\s\-]+)\s+constituency"),
+]
+GENERIC_TERMS = {"List", "Lok", "Sabha", "India", "Indian"}
+
 def google_search(query, start=1):
     """Search Google Custom Search API"""
     params = {
@@ -27,7 +45,7 @@ def google_search(query, start=1):
         "num": 10,
         "start": start
     }
-    r = requests.get(GOOGLE_URL, params=params, timeout=15)
+    r = session.get(GOOGLE_URL, params=params, timeout=15)
     if r.status_code != 200:
         print(f"Search failed with status {r.status_code}")
         return []
@@ -46,10 +64,13 @@ def extract_constituencies_from_search():
         "Indian parliamentary constituencies 2024"
     ]
     
-    for query in queries:
-        print(f" Searching: {query}")
-        results = google_search(query)
-        
+    print(f" Searching {len(queries)} queries concurrently")
+    
+    # Searches are network-bound, so issue them in parallel
+    with ThreadPoolExecutor(max_workers=min(SEARCH_WORKERS, len(queries))) as executor:
+        results_per_query = list(executor.map(google_search, queries))
+    
+    for results in results_per_query:
         for item in results:
             link = item.get("link", "")
             snippet = item.get("snippet", "")
@@ -62,20 +83,12 @@ def extract_constituencies_from_search():
             # Combine text for extraction
             text = f"{title} {snippet}"
             
-            # Pattern 1: "Name (Lok Sabha constituency)"
-            matches1 = re.findall(r"([A-Z][A-Za-z\s\-]+)\s+\(Lok Sabha constituency\)", text)
-            
-            # Pattern 2: "Name Lok Sabha"
-            matches2 = re.findall(r"([A-Z][A-Za-z\s\-]+)\s+Lok Sabha", text)
-            
-            # Pattern 3: State-wise mentions
-            matches3 = re.findall(r"([A-Z][A-Za-z\s\-]+)\s+constituency", text)
-            
-            for name in matches1 + matches2 + matches3:
-                cleaned = name.strip()
-                # Filter out generic terms
-                if len(cleaned) > 3 and cleaned not in ["List", "Lok", "Sabha", "India", "Indian"]:
-                    constituencies[cleaned] = True
+            for pattern in CONSTITUENCY_PATTERNS:
+                for name in pattern.findall(text):
+                    cleaned = name.strip()
+                    # Filter out generic terms
+                    if len(cleaned) > 3 and cleaned not in GENERIC_TERMS:
+                        constituencies[cleaned] = True
     
     print(f"Extracted {len(constituencies)} unique constituency names")
     return list(constituencies.keys()), sources
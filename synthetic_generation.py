@@ -1,11 +1,11 @@
 import os
-import math
+import numpy as np
 import pandas as pd
-from faker import Faker
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime, timedelta
 
-fake = Faker('en_IN')  # Indian locale for Faker
-Faker.seed(42)  # Reproducibility
+SEED = 42  # Reproducibility
 
 INPUT_DIR = "data"
 OUTPUT_DIR = "output"
@@ -17,6 +17,10 @@ SYSTEM_LOAD_OUT = f"{OUTPUT_DIR}/pc_system_load_synthetic.csv"
 VOTER_DEMOGRAPHICS_OUT = f"{OUTPUT_DIR}/pc_voter_demographics_synthetic.csv"
 SOURCE_LOG_OUT = f"{OUTPUT_DIR}/data_sources.txt"
 
+def write_csv(df, path):
+    """Write a DataFrame through Arrow's multi-threaded CSV writer."""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
 # ================= LOAD CONSTITUENCIES =================
 
 if not os.path.exists(CONSTITUENCIES_FILE):
@@ -43,171 +47,131 @@ print(f" Using realistic anchors:")
 print(f"   - Avg voters per PC: {AVG_VOTERS_PER_PC:,.0f}")
 print(f"   - Avg Form 6 per PC: {AVG_FORM6_PER_PC:,.0f}")
 
-# ================= CATEGORY A: VOTER DEMOGRAPHICS =================
-
-print("\n📈 Generating voter demographics...")
-
-demographic_rows = []
-
-for idx, row in pc_df.iterrows():
-    pc_id = row['pc_id']
-    state = row['state']
-    constituency = row['constituency_name']
+# ================= SYNTHETIC GENERATION =================
+
+def generate_synthetic_frames(pc_df, rng):
+    """Generate all three data categories in one vectorized pass over pc_df"""
+    n = len(pc_df)
+    identity = {
+        'pc_id': pc_df['pc_id'].to_numpy(),
+        'state': pc_df['state'].to_numpy(),
+        'constituency_name': pc_df['constituency_name'].to_numpy(),
+    }
+    provenance = {
+        'data_origin': 'synthetic',
+        'anchor_level': ANCHOR_LEVEL
+    }
     
-    # Use Faker for realistic variance in voter counts
-    total_voters = fake.random_int(
-        min=int(AVG_VOTERS_PER_PC * 0.5),
-        max=int(AVG_VOTERS_PER_PC * 1.8)
+    # ---------- CATEGORY A: VOTER DEMOGRAPHICS ----------
+    
+    total_voters = rng.integers(
+        int(AVG_VOTERS_PER_PC * 0.5),
+        int(AVG_VOTERS_PER_PC * 1.8) + 1,
+        size=n
     )
     
     # Gender distribution (realistic Indian ratios)
-    male_ratio = fake.pyfloat(min_value=0.48, max_value=0.54)
-    male_voters = int(total_voters * male_ratio)
+    male_voters = (total_voters * rng.uniform(0.48, 0.54, n)).astype(np.int64)
     female_voters = total_voters - male_voters
     
-    # Age distribution (using Faker for variation)
-    age_18_25 = int(total_voters * fake.pyfloat(min_value=0.15, max_value=0.22))
-    age_26_40 = int(total_voters * fake.pyfloat(min_value=0.30, max_value=0.38))
-    age_41_60 = int(total_voters * fake.pyfloat(min_value=0.28, max_value=0.35))
+    # Age distribution
+    age_18_25 = (total_voters * rng.uniform(0.15, 0.22, n)).astype(np.int64)
+    age_26_40 = (total_voters * rng.uniform(0.30, 0.38, n)).astype(np.int64)
+    age_41_60 = (total_voters * rng.uniform(0.28, 0.35, n)).astype(np.int64)
     age_60_plus = total_voters - (age_18_25 + age_26_40 + age_41_60)
     
     # Literacy rate (varied by region)
-    literacy_rate = fake.pyfloat(min_value=55.0, max_value=95.0)
+    literacy_rate = rng.uniform(55.0, 95.0, n)
     
     # Voter turnout (last election)
-    turnout_rate = fake.pyfloat(min_value=45.0, max_value=85.0)
+    turnout_rate = rng.uniform(45.0, 85.0, n)
     
-    demographic_rows.append({
-        'pc_id': pc_id,
-        'state': state,
-        'constituency_name': constituency,
-        'total_registered_voters': total_voters,
-        'male_voters': male_voters,
-        'female_voters': female_voters,
-        'age_18_25': age_18_25,
-        'age_26_40': age_26_40,
-        'age_41_60': age_41_60,
-        'age_60_plus': age_60_plus,
-        'literacy_rate_percent': round(literacy_rate, 2),
-        'last_election_turnout_percent': round(turnout_rate, 2),
-        'data_origin': 'synthetic',
-        'anchor_level': ANCHOR_LEVEL
-    })
-
-demo_df = pd.DataFrame(demographic_rows)
-demo_df.to_csv(VOTER_DEMOGRAPHICS_OUT, index=False)
-print(f" Saved to {VOTER_DEMOGRAPHICS_OUT}")
-
-# ================= CATEGORY B: MIGRATION (Form 6 data) =================
-
-print("\n Generating migration data...")
-
-migration_rows = []
-
-for idx, row in pc_df.iterrows():
-    pc_id = row['pc_id']
-    state = row['state']
-    constituency = row['constituency_name']
+    # ---------- CATEGORY B: MIGRATION (Form 6 data) ----------
     
-    # Use Faker for realistic Form 6 request volumes
-    base_form6 = fake.random_int(
-        min=int(AVG_FORM6_PER_PC * 0.4),
-        max=int(AVG_FORM6_PER_PC * 2.0)
+    # Form 6 request volumes
+    base_form6 = rng.integers(
+        int(AVG_FORM6_PER_PC * 0.4),
+        int(AVG_FORM6_PER_PC * 2.0) + 1,
+        size=n
     )
     
     # Inward vs outward migration (using realistic distributions)
-    inward_ratio = fake.pyfloat(min_value=0.35, max_value=0.65)
-    inward = int(base_form6 * inward_ratio)
+    inward = (base_form6 * rng.uniform(0.35, 0.65, n)).astype(np.int64)
     outward = base_form6 - inward
     net = inward - outward
     
-    # Additional migrations (using Faker for variance)
-    form_7_deletions = fake.random_int(
-        min=int(base_form6 * 0.05),
-        max=int(base_form6 * 0.15)
+    # Additional migrations
+    form_7_deletions = rng.integers(
+        (base_form6 * 0.05).astype(np.int64),
+        (base_form6 * 0.15).astype(np.int64) + 1
     )
-    
-    form_8_corrections = fake.random_int(
-        min=int(base_form6 * 0.10),
-        max=int(base_form6 * 0.25)
+    form_8_corrections = rng.integers(
+        (base_form6 * 0.10).astype(np.int64),
+        (base_form6 * 0.25).astype(np.int64) + 1
     )
     
-    migration_rows.append({
-        'pc_id': pc_id,
-        'state': state,
-        'constituency_name': constituency,
-        'form6_addition_requests': base_form6,
-        'form6_inward_migration': inward,
-        'form6_outward_migration': outward,
-        'net_migration': net,
-        'form7_deletion_requests': form_7_deletions,
-        'form8_correction_requests': form_8_corrections,
-        'data_origin': 'synthetic',
-        'anchor_level': ANCHOR_LEVEL
-    })
-
-migration_df = pd.DataFrame(migration_rows)
-migration_df.to_csv(MIGRATION_OUT, index=False)
-print(f" Saved to {MIGRATION_OUT}")
-
-# ================= CATEGORY C: SYSTEM LOAD & PROCESSING =================
-
-print("\n⚙️  Generating system load data...")
-
-system_rows = []
-
-for idx, mig_row in migration_df.iterrows():
-    pc_id = mig_row['pc_id']
-    state = mig_row['state']
-    constituency = mig_row['constituency_name']
+    # ---------- CATEGORY C: SYSTEM LOAD & PROCESSING ----------
     
-    total_requests = (
-        mig_row['form6_addition_requests'] + 
-        mig_row['form7_deletion_requests'] + 
-        mig_row['form8_correction_requests']
-    )
+    total_requests = base_form6 + form_7_deletions + form_8_corrections
     
-    # Use Faker for processing metrics
-    approved = int(total_requests * fake.pyfloat(min_value=0.75, max_value=0.92))
-    rejected = int(total_requests * fake.pyfloat(min_value=0.03, max_value=0.12))
-    pending = max(0, total_requests - (approved + rejected))  # Ensure non-negative
+    # Processing outcomes
+    approved = (total_requests * rng.uniform(0.75, 0.92, n)).astype(np.int64)
+    rejected = (total_requests * rng.uniform(0.03, 0.12, n)).astype(np.int64)
+    pending = np.maximum(0, total_requests - (approved + rejected))  # Ensure non-negative
     
-    # Objections raised (using Faker)
-    if total_requests > 0:
-        objections = fake.random_int(
-            min=max(0, int(total_requests * 0.01)),
-            max=int(total_requests * 0.08)
-        )
-    else:
-        objections = 0
+    # Objections raised (zero-request constituencies draw from [0, 0])
+    objections = rng.integers(
+        np.maximum(0, (total_requests * 0.01).astype(np.int64)),
+        (total_requests * 0.08).astype(np.int64) + 1
+    )
     
-    objections_resolved = int(objections * fake.pyfloat(min_value=0.60, max_value=0.95))
-    objections_pending = max(0, objections - objections_resolved)  # Ensure non-negative
+    objections_resolved = (objections * rng.uniform(0.60, 0.95, n)).astype(np.int64)
+    objections_pending = np.maximum(0, objections - objections_resolved)  # Ensure non-negative
     
     # Processing time (realistic based on load)
     # Higher load = longer processing time
-    load_factor = math.log(total_requests + 1)
-    avg_processing_days = fake.pyfloat(
-        min_value=max(5, load_factor * 3),
-        max_value=min(90, load_factor * 8)
+    load_factor = np.log1p(total_requests)
+    avg_processing_days = rng.uniform(
+        np.maximum(5, load_factor * 3),
+        np.minimum(90, load_factor * 8)
     )
     
     # Freeze period pending cases (pre-election freeze)
-    if pending > 0:
-        freeze_min = int(pending * 0.3)
-        freeze_max = int(pending * 0.7)
-        freeze_pending = fake.random_int(min=freeze_min, max=max(freeze_min, freeze_max))
-    else:
-        freeze_pending = 0
+    freeze_min = (pending * 0.3).astype(np.int64)
+    freeze_max = np.maximum(freeze_min, (pending * 0.7).astype(np.int64))
+    freeze_pending = rng.integers(freeze_min, freeze_max + 1)
     
     # Officer workload
-    officers_assigned = fake.random_int(min=2, max=12)
-    cases_per_officer = round(total_requests / officers_assigned, 1)
+    officers_assigned = rng.integers(2, 12 + 1, size=n)
+    cases_per_officer = (total_requests / officers_assigned).round(1)
     
-    system_rows.append({
-        'pc_id': pc_id,
-        'state': state,
-        'constituency_name': constituency,
+    demo_df = pd.DataFrame({
+        **identity,
+        'total_registered_voters': total_voters,
+        'male_voters': male_voters,
+        'female_voters': female_voters,
+        'age_18_25': age_18_25,
+        'age_26_40': age_26_40,
+        'age_41_60': age_41_60,
+        'age_60_plus': age_60_plus,
+        'literacy_rate_percent': literacy_rate.round(2),
+        'last_election_turnout_percent': turnout_rate.round(2),
+        **provenance
+    })
+    
+    migration_df = pd.DataFrame({
+        **identity,
+        'form6_addition_requests': base_form6,
+        'form6_inward_migration': inward,
+        'form6_outward_migration': outward,
+        'net_migration': net,
+        'form7_deletion_requests': form_7_deletions,
+        'form8_correction_requests': form_8_corrections,
+        **provenance
+    })
+    
+    system_df = pd.DataFrame({
+        **identity,
         'total_requests': total_requests,
         'approved': approved,
         'rejected': rejected,
@@ -216,16 +180,28 @@ for idx, mig_row in migration_df.iterrows():
         'objections_resolved': objections_resolved,
         'objections_pending': objections_pending,
         'freeze_period_pending': freeze_pending,
-        'avg_processing_time_days': round(avg_processing_days, 1),
+        'avg_processing_time_days': avg_processing_days.round(1),
         'officers_assigned': officers_assigned,
         'cases_per_officer': cases_per_officer,
-        'data_origin': 'synthetic',
-        'anchor_level': ANCHOR_LEVEL
+        **provenance
     })
+    
+    return demo_df, migration_df, system_df
+
+
+print("\n📈 Generating voter demographics, migration and system load data...")
+
+# One seeded generator for every numeric draw, so the RNG stream is deterministic
+rng = np.random.default_rng(SEED)
+demo_df, migration_df, system_df = generate_synthetic_frames(pc_df, rng)
 
-system_df = pd.DataFrame(system_rows)
-system_df.to_csv(SYSTEM_LOAD_OUT, index=False)
-print(f" Saved to {SYSTEM_LOAD_OUT}")
+for frame, path in [
+    (demo_df, VOTER_DEMOGRAPHICS_OUT),
+    (migration_df, MIGRATION_OUT),
+    (system_df, SYSTEM_LOAD_OUT),
+]:
+    write_csv(frame, path)
+    print(f" Saved to {path}")
 
 # ================= SOURCES & METHODOLOGY LOG =================
 
@@ -258,8 +234,8 @@ with open(SOURCE_LOG_OUT, "w", encoding="utf-8") as f:
     
     f.write("SYNTHETIC DATA GENERATION METHOD:\n")
     f.write("-" * 70 + "\n")
-    f.write("Library: Faker (Python) with Indian locale\n")
-    f.write("Seed: 42 (for reproducibility)\n\n")
+    f.write("Library: NumPy random Generator (numpy.random.default_rng)\n")
+    f.write(f"Seed: {SEED} (for reproducibility)\n\n")
     
     f.write("Data Categories:\n")
     f.write("1. Voter Demographics:\n")